@@ -1,8 +1,9 @@
 import sys
 import subprocess
-import pkg_resources
+import importlib.util
 import os
 import sqlite3
+from math import pi
 
 # Para usar estilos y widgets mejorados (ttk)
 import tkinter as tk
@@ -11,8 +12,6 @@ from tkinter import messagebox
 
 from PIL import Image, ImageTk
 from io import BytesIO
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # ============================
 # 1. Verificación e Instalación de Dependencias (opcional)
@@ -27,11 +26,20 @@ def install_packages(packages):
         print(f"Error al instalar paquetes: {e}")
         sys.exit(1)
 
-required_packages = {'pillow', 'matplotlib'}
-installed_packages = {pkg.key for pkg in pkg_resources.working_set}
-missing_packages = required_packages - installed_packages
+# Módulo que se importa -> paquete que lo instala.
+# Pillow-SIMD es un reemplazo directo de Pillow con redimensionado vectorizado.
+# Desinstala Pillow antes de instalarlo: pip uninstall pillow
+required_packages = {'PIL': 'pillow-simd', 'matplotlib': 'matplotlib'}
+
+def paquetes_faltantes():
+    """
+    Devuelve los paquetes cuyos módulos no se encuentran, sin importarlos.
+    """
+    return {paquete for modulo, paquete in required_packages.items()
+            if importlib.util.find_spec(modulo) is None}
 
 # Descomenta si deseas instalación automática
+# missing_packages = paquetes_faltantes()
 # if missing_packages:
 #     print(f"Instalando paquetes faltantes: {missing_packages}")
 #     install_packages(missing_packages)
@@ -53,6 +61,15 @@ def resource_path(relative_path):
 # ============================
 # 3. Gestión de la Base de Datos
 # ============================
+# Consulta con columnas explícitas, en el orden que espera mostrar_pokemon
+_SQL_POKEDEX = (
+    "SELECT id, nombre, tipo1, tipo2, hp, ataque, defensa, "
+    "ataque_especial, defensa_especial, velocidad, imagen FROM pokemon"
+)
+
+# Todos los Pokémon cargados en memoria, indexados por nombre (ver main)
+POKEDEX = {}
+
 def conectar_db():
     """
     Conecta a la base de datos 'pokemon.db' y verifica que exista.
@@ -63,20 +80,63 @@ def conectar_db():
         sys.exit(1)
     return sqlite3.connect(db_path)
 
-def buscar_pokemon_en_db(nombre):
+def cargar_pokedex():
     """
-    Busca el Pokémon por nombre en la base de datos.
+    Carga una sola vez toda la tabla 'pokemon' en el diccionario POKEDEX.
+    La tabla es pequeña y de solo lectura, así que cada búsqueda se reduce
+    a una consulta en el diccionario y la conexión se cierra al terminar.
     """
     conn = conectar_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM pokemon WHERE nombre=?", (nombre,))
-    pokemon = cursor.fetchone()
+    cursor = conn.execute(_SQL_POKEDEX)
+    POKEDEX.clear()
+    POKEDEX.update((fila[1], fila) for fila in cursor.fetchall())
     conn.close()
-    return pokemon
+
+def buscar_pokemon_en_db(nombre):
+    """
+    Busca el Pokémon por nombre en los datos cargados de la base de datos.
+    """
+    return POKEDEX.get(nombre)
 
 # ============================
 # 4. Funciones de Lógica
 # ============================
+ETIQUETAS_STATS = ['HP', 'Ataque', 'Defensa', 'At. Especial', 'Def. Especial', 'Velocidad']
+# Ángulos del gráfico radial; el primero se repite para cerrar el polígono
+ANGULOS = [n / float(len(ETIQUETAS_STATS)) * 2 * pi for n in range(len(ETIQUETAS_STATS))]
+ANGULOS += ANGULOS[:1]
+
+# Búsqueda pendiente de la tecla Enter (ver programar_busqueda)
+RETARDO_BUSQUEDA_MS = 150
+_LAST_JOB = None
+
+# Etiquetas de resultados creadas una sola vez (ver crear_resultados)
+_LBL_ID = _LBL_NOMBRE = _LBL_TIPO1 = _LBL_TIPO2 = _LBL_IMG = None
+
+# Gráfico radial creado en la primera búsqueda (ver crear_grafico)
+_FIG = _AX = _POLY = _LINE = _CANVAS = None
+
+# Imágenes ya procesadas, indexadas por nombre del Pokémon (ver cargar_sprites)
+_SPRITE = {}
+
+def cargar_sprites():
+    """
+    Decodifica y redimensiona una sola vez la imagen de cada Pokémon.
+    Debe llamarse después de crear la ventana, ya que PhotoImage necesita Tk.
+    """
+    for nombre, pokemon in POKEDEX.items():
+        imagen_blob = pokemon[-1]
+        if not imagen_blob:
+            continue
+        try:
+            imagen = Image.open(BytesIO(imagen_blob))
+            # Las imágenes son PNG con paleta (modo 'P'): en ese modo Pillow
+            # ignora el filtro y siempre redimensiona con NEAREST
+            imagen = imagen.resize((150, 150), Image.Resampling.BILINEAR)
+            _SPRITE[nombre] = ImageTk.PhotoImage(imagen)
+        except Exception as e:
+            print(f"Error al procesar la imagen de '{nombre}': {e}")
+
 def buscar_pokemon():
     """
     Lógica para el botón 'Buscar'.
@@ -93,81 +153,105 @@ def buscar_pokemon():
 
     mostrar_pokemon(pokemon)
 
+def programar_busqueda(event=None):
+    """
+    Lógica para la tecla Enter: agrupa pulsaciones seguidas y solo
+    ejecuta la última búsqueda tras una breve pausa.
+    """
+    global _LAST_JOB
+    if _LAST_JOB is not None:
+        entry_nombre.after_cancel(_LAST_JOB)
+    _LAST_JOB = entry_nombre.after(RETARDO_BUSQUEDA_MS, _ejecutar_busqueda)
+
+def _ejecutar_busqueda():
+    global _LAST_JOB
+    _LAST_JOB = None
+    buscar_pokemon()
+
+def crear_resultados(frame):
+    """
+    Crea una sola vez las etiquetas del área de resultados.
+    En cada búsqueda solo se actualiza su contenido (ver mostrar_pokemon).
+    """
+    global _LBL_ID, _LBL_NOMBRE, _LBL_TIPO1, _LBL_TIPO2, _LBL_IMG
+    _LBL_ID = ttk.Label(frame, font=("Arial", 12))
+    _LBL_NOMBRE = ttk.Label(frame, font=("Arial", 12))
+    _LBL_TIPO1 = ttk.Label(frame, font=("Arial", 12))
+    _LBL_TIPO2 = ttk.Label(frame, font=("Arial", 12))
+
+    _LBL_ID.grid(row=0, column=0, sticky="w", padx=5, pady=2)
+    _LBL_NOMBRE.grid(row=1, column=0, sticky="w", padx=5, pady=2)
+    _LBL_TIPO1.grid(row=2, column=0, sticky="w", padx=5, pady=2)
+    _LBL_TIPO2.grid(row=3, column=0, sticky="w", padx=5, pady=2)
+
+    # Muestra la imagen o, si no la hay, un mensaje en rojo
+    _LBL_IMG = ttk.Label(frame, font=("Arial", 12), foreground="red")
+    _LBL_IMG.grid(row=0, column=1, rowspan=4, padx=10, pady=10)
+
+def crear_grafico(frame):
+    """
+    Crea una sola vez la figura del gráfico radial con sus ejes y etiquetas.
+    Se llama en la primera búsqueda para no importar matplotlib al arrancar;
+    después solo se actualizan los datos (ver mostrar_pokemon).
+    """
+    global _FIG, _AX, _POLY, _LINE, _CANVAS
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    _FIG = Figure(figsize=(4, 3), dpi=100)
+    _AX = _FIG.add_subplot(111, polar=True)
+
+    ceros = [0] * len(ANGULOS)
+    _POLY = _AX.fill(ANGULOS, ceros, color='blue', alpha=0.25)[0]
+    _LINE = _AX.plot(ANGULOS, ceros, color='blue', linewidth=2)[0]
+    _AX.set_xticks(ANGULOS[:-1])
+    _AX.set_xticklabels(ETIQUETAS_STATS, fontsize=10)
+    _AX.set_yticks([20, 40, 60, 80, 100])
+    _AX.set_yticklabels([20, 40, 60, 80, 100], fontsize=8)
+
+    # Integrar el gráfico en Tkinter
+    _CANVAS = FigureCanvasTkAgg(_FIG, frame)
+    _CANVAS.get_tk_widget().grid(row=4, column=0, columnspan=2, pady=10, sticky="n")
+
 def mostrar_pokemon(pokemon):
     """
     Muestra datos y gráficos del Pokémon en la sección de resultados.
     """
-    # Limpiar área de resultados
-    for widget in frame_resultados.winfo_children():
-        widget.destroy()
-
     # Desempaquetar los campos de la base de datos
     # Ejemplo: (ID, Nombre, Tipo1, Tipo2, HP, Ataque, Defensa, 
     # At.Especial, Def.Especial, Velocidad, Imagen)
     (pokemon_id, nombre, tipo1, tipo2, hp, ataque, defensa, atesp, defesp, velocidad, imagen_blob) = pokemon
 
     # Mostrar información
-    lbl_id = ttk.Label(frame_resultados, text=f"ID: {pokemon_id}", font=("Arial", 12))
-    lbl_nombre = ttk.Label(frame_resultados, text=f"Nombre: {nombre}", font=("Arial", 12))
-    lbl_tipo1 = ttk.Label(frame_resultados, text=f"Tipo 1: {tipo1}", font=("Arial", 12))
-    lbl_tipo2 = ttk.Label(frame_resultados, text=f"Tipo 2: {tipo2 if tipo2 else 'N/A'}", font=("Arial", 12))
-
-    lbl_id.grid(row=0, column=0, sticky="w", padx=5, pady=2)
-    lbl_nombre.grid(row=1, column=0, sticky="w", padx=5, pady=2)
-    lbl_tipo1.grid(row=2, column=0, sticky="w", padx=5, pady=2)
-    lbl_tipo2.grid(row=3, column=0, sticky="w", padx=5, pady=2)
+    _LBL_ID.config(text=f"ID: {pokemon_id}")
+    _LBL_NOMBRE.config(text=f"Nombre: {nombre}")
+    _LBL_TIPO1.config(text=f"Tipo 1: {tipo1}")
+    _LBL_TIPO2.config(text=f"Tipo 2: {tipo2 if tipo2 else 'N/A'}")
 
     # Mostrar imagen
-    if imagen_blob:
-        try:
-            imagen = Image.open(BytesIO(imagen_blob))
-            imagen = imagen.resize((150, 150), Image.Resampling.LANCZOS)
-            img_tk = ImageTk.PhotoImage(imagen)
-            lbl_imagen = ttk.Label(frame_resultados, image=img_tk)
-            lbl_imagen.image = img_tk  # Evita que Python elimine la referencia
-            lbl_imagen.grid(row=0, column=1, rowspan=4, padx=10, pady=10)
-        except Exception as e:
-            print(f"Error al procesar la imagen: {e}")
-            lbl_error_imagen = ttk.Label(
-                frame_resultados,
-                text="Error al cargar la imagen.",
-                font=("Arial", 12),
-                foreground="red"
-            )
-            lbl_error_imagen.grid(row=0, column=1, rowspan=4, padx=10, pady=10)
+    img_tk = _SPRITE.get(nombre)
+    if img_tk:
+        _LBL_IMG.config(image=img_tk, text="")
+        _LBL_IMG.image = img_tk  # Evita que Python elimine la referencia
+    elif imagen_blob:
+        # La imagen existe pero no se pudo procesar en cargar_sprites
+        _LBL_IMG.config(image="", text="Error al cargar la imagen.")
+        _LBL_IMG.image = None
     else:
-        lbl_no_imagen = ttk.Label(
-            frame_resultados,
-            text="No hay imagen disponible.",
-            font=("Arial", 12),
-            foreground="red"
-        )
-        lbl_no_imagen.grid(row=0, column=1, rowspan=4, padx=10, pady=10)
-
-    # Crear gráfico radial
-    stats = [hp, ataque, defensa, atesp, defesp, velocidad]
-    labels = ['HP', 'Ataque', 'Defensa', 'At. Especial', 'Def. Especial', 'Velocidad']
+        _LBL_IMG.config(image="", text="No hay imagen disponible.")
+        _LBL_IMG.image = None
 
-    figure = Figure(figsize=(4, 3), dpi=100)
-    subplot = figure.add_subplot(111, polar=True)
+    # Actualizar gráfico radial (solo cambian los datos)
+    if _CANVAS is None:
+        crear_grafico(frame_resultados)
 
-    from math import pi
-    angles = [n / float(len(labels)) * 2 * pi for n in range(len(labels))]
-    angles += angles[:1]
+    stats = [hp, ataque, defensa, atesp, defesp, velocidad]
     stats += stats[:1]
 
-    subplot.fill(angles, stats, color='blue', alpha=0.25)
-    subplot.plot(angles, stats, color='blue', linewidth=2)
-    subplot.set_xticks(angles[:-1])
-    subplot.set_xticklabels(labels, fontsize=10)
-    subplot.set_yticks([20, 40, 60, 80, 100])
-    subplot.set_yticklabels([20, 40, 60, 80, 100], fontsize=8)
-
-    # Integrar el gráfico en Tkinter
-    canvas = FigureCanvasTkAgg(figure, frame_resultados)
-    canvas.draw()
-    canvas_widget = canvas.get_tk_widget()
-    canvas_widget.grid(row=4, column=0, columnspan=2, pady=10, sticky="n")
+    _POLY.set_xy(list(zip(ANGULOS, stats)))
+    _LINE.set_data(ANGULOS, stats)
+    _AX.set_ylim(0, max(100, *stats))
+    _CANVAS.draw_idle()
 
 # ============================
 # 5. Creación de la Interfaz Gráfica
@@ -176,6 +260,10 @@ def main():
     root = tk.Tk()
     root.title("Pokédex Mejorada")
 
+    # Cargar la base de datos una sola vez al inicio
+    cargar_pokedex()
+    cargar_sprites()
+
     # Ajustar tamaño de la ventana y permitir (o no) redimensionar
     root.geometry("600x500")
     root.minsize(600, 500)  # Tamaño mínimo para una mejor experiencia
@@ -206,6 +294,7 @@ def main():
     global entry_nombre
     entry_nombre = ttk.Entry(frame_busqueda, font=("Arial", 12), width=20)
     entry_nombre.grid(row=1, column=0, sticky="w", pady=5)
+    entry_nombre.bind('<Return>', programar_busqueda)
 
     btn_buscar = ttk.Button(frame_busqueda, text="Buscar", command=buscar_pokemon)
     btn_buscar.grid(row=1, column=1, padx=10, sticky="e")
@@ -219,6 +308,8 @@ def main():
     frame_resultados.columnconfigure(0, weight=1)
     frame_resultados.rowconfigure(4, weight=1)
 
+    crear_resultados(frame_resultados)
+
     # Iniciar la aplicación
     root.mainloop()
 